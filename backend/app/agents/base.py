@@ -4,15 +4,34 @@ from __future__ import annotations
 
 import abc
 import asyncio
-from datetime import datetime
+import random
+import time
 from typing import Any, Optional
 
-from app.llm.client import LLMClient
+from app.llm.cache import get_prompt_cache
+from app.llm.client import get_llm_client
 from app.models.enums import AgentRole, AgentStatus, EventType
 from app.models.events import RunEvent
+from app.services.event_bus import event_bus
 from app.services.run_store import run_store
 from fastapi import HTTPException
 
+# Backoff for LLM timeouts: capped exponential delay plus jitter, bounded by a total deadline.
+LLM_RETRY_MAX_DELAY = 30.0
+LLM_RETRY_JITTER = 1.0
+LLM_RETRY_DEADLINE = 120.0
+
+PREVIEW_MAX_CHARS = 500
+
+
+def _preview(text: str, limit: int = PREVIEW_MAX_CHARS) -> str:
+    """Return text stripped and truncated for inclusion in event payloads."""
+
+    preview = text.strip()
+    if len(preview) > limit:
+        preview = f"{preview[: limit - 3]}..."
+    return preview
+
 
 class BaseAgent(abc.ABC):
     """Abstract base agent providing common utilities."""
@@ -21,19 +40,15 @@ class BaseAgent(abc.ABC):
         self.run_id = run_id
         self.name = name
         self.role = role
-        self.llm = LLMClient()
+        self.llm = get_llm_client()
         self.agent_id: Optional[str] = None
 
     async def register(self, brief: Optional[str] = None) -> None:
         agent_state = await run_store.add_agent(self.run_id, self.name, self.role, brief=brief)
         self.agent_id = agent_state.id
-        await run_store.add_event(
-            RunEvent(
-                run_id=self.run_id,
-                type=EventType.AGENT_SPAWNED,
-                agent_id=self.agent_id,
-                payload={"name": self.name, "role": self.role.value, "brief": brief},
-            )
+        await self.emit_event(
+            EventType.AGENT_SPAWNED,
+            {"name": self.name, "role": self.role.value, "brief": brief},
         )
 
     async def emit_event(self, event_type: EventType, payload: Optional[dict] = None) -> None:
@@ -50,6 +65,8 @@ class BaseAgent(abc.ABC):
         if not self.agent_id:
             return
         await run_store.update_agent_status(self.run_id, self.agent_id, status=status, error=error)
+        if status in (AgentStatus.COMPLETED, AgentStatus.FAILED):
+            await run_store.flush_events()
 
     async def record_finding(self, content: str) -> None:
         if not self.agent_id:
@@ -62,38 +79,98 @@ class BaseAgent(abc.ABC):
         prompt: str,
         system_prompt: Optional[str] = None,
         retries: int = 4,
+        cacheable_system: bool = False,
     ) -> str:
-        prompt_preview = prompt.strip()
-        if len(prompt_preview) > 500:
-            prompt_preview = f"{prompt_preview[:497]}..."
+        # Everything derived from the inputs is computed once, outside the retry loop.
+        prompt_preview = _preview(prompt)
+        system_prompt_preview = _preview(system_prompt) if isinstance(system_prompt, str) else None
 
-        system_prompt_preview = system_prompt.strip() if isinstance(system_prompt, str) else None
-        if system_prompt_preview and len(system_prompt_preview) > 500:
-            system_prompt_preview = f"{system_prompt_preview[:497]}..."
+        settings = self.llm._settings
+        model_name = getattr(settings, "openai_model", None)
 
-        model_name = getattr(self.llm._settings, "openai_model", None)
+        cache = get_prompt_cache() if settings.llm_cache_enabled else None
+        cache_key: Optional[str] = None
+        if cache is not None:
+            cache_key = cache.make_key(prompt, system_prompt, model_name)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                await self.emit_event(
+                    EventType.TOOL_CALL,
+                    {
+                        "tool": "llm",
+                        "model": model_name,
+                        "attempts": 0,
+                        "final": "cached",
+                        "prompt": prompt_preview,
+                        "system_prompt": system_prompt_preview,
+                    },
+                )
+                return cached
 
-        for attempt in range(retries + 1):
+        forward_tokens = settings.llm_stream_tokens
+        started_at = time.monotonic()
+        attempts_made = 0
+        outcome = "error"
+        try:
+            for attempt in range(retries + 1):
+                attempts_made = attempt + 1
+                chunks: list[str] = []
+                try:
+                    result = await self._stream_completion(prompt, system_prompt, cacheable_system, chunks)
+                except HTTPException as exc:
+                    # Tokens already forwarded to live subscribers can't be retracted, so retrying
+                    # would stream the completion to them a second time.
+                    retryable = not (forward_tokens and chunks)
+                    if exc.status_code == 504 and attempt < retries and retryable:
+                        delay = min(LLM_RETRY_MAX_DELAY, 2**attempt) + random.uniform(0, LLM_RETRY_JITTER)
+                        if time.monotonic() - started_at + delay <= LLM_RETRY_DEADLINE:
+                            await asyncio.sleep(delay)
+                            continue
+                    if exc.status_code == 504:
+                        outcome = "timeout"
+                    raise
+                outcome = "success"
+                if cache is not None and cache_key is not None:
+                    cache.set(cache_key, result)
+                return result
+        finally:
+            # One consolidated event per LLM call instead of one per attempt.
             await self.emit_event(
                 EventType.TOOL_CALL,
                 {
                     "tool": "llm",
                     "model": model_name,
-                    "attempt": attempt + 1,
+                    "attempts": attempts_made,
                     "max_attempts": retries + 1,
-                    "retry": attempt > 0,
+                    "final": outcome,
                     "prompt": prompt_preview,
                     "system_prompt": system_prompt_preview,
                 },
             )
-            try:
-                return await self.llm.complete(prompt=prompt, system_prompt=system_prompt)
-            except HTTPException as exc:
-                if exc.status_code == 504 and attempt < retries:
-                    delay = 2**attempt
-                    await asyncio.sleep(delay)
-                    continue
-                raise
+
+    async def _stream_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        cacheable_system: bool,
+        chunks: list[str],
+    ) -> str:
+        """Stream a completion into chunks, forwarding each token to live subscribers if enabled."""
+
+        forward_tokens = self.llm._settings.llm_stream_tokens
+        async for chunk in self.llm.stream(prompt, system_prompt=system_prompt, cacheable_system=cacheable_system):
+            chunks.append(chunk)
+            if forward_tokens:
+                # Tokens go straight to live subscribers; they are not kept in the run history.
+                await event_bus.publish(
+                    RunEvent(
+                        run_id=self.run_id,
+                        type=EventType.LLM_TOKEN,
+                        agent_id=self.agent_id,
+                        payload={"delta": chunk},
+                    )
+                )
+        return "".join(chunks)
 
     @abc.abstractmethod
     async def run(self) -> Any:  # pragma: no cover - implemented by subclasses
@@ -2,116 +2,130 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
-from typing import Any, List, Sequence
+from typing import Any, List, Optional, Sequence
 
 from app.agents.base import BaseAgent
 from app.models.enums import AgentRole, AgentStatus, EventType
+from app.utils.json_parser import find_json_object
+
+_URL_RE = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+')
+_MARKER_RE = re.compile(r'\[\d+\]')
+
+# Static instructions live in the system prompt so providers can reuse the cached prefix.
+CITATION_SYSTEM_PROMPT = """
+You are a research citation specialist. Your task is to:
+1. Synthesize the research findings into a coherent report
+2. Add proper citations with source URLs
+3. Format the output as JSON with 'report' and 'citations' keys
+
+Instructions:
+- Create a comprehensive research report based on the findings
+- Include inline citations like [1], [2], etc. in the report
+- List all sources with their URLs in the citations array
+- Make sure each citation has both 'citation' text and 'url' if available
+
+Output format:
+{"report": "Your synthesized report with [1], [2] citations...", "citations": [{"citation": "Source 1", "url": "https://example.com"}, ...]}
+"""
 
 
 class CitationAgent(BaseAgent):
     """Processes findings and attaches source attributions."""
 
-    def __init__(self, run_id: str, findings: Sequence[dict]) -> None:
+    def __init__(self, run_id: str, findings: Sequence[dict] = ()) -> None:
         super().__init__(run_id, name="Citation Agent", role=AgentRole.CITATION)
-        self.findings = list(findings)
+        self.findings: List[dict] = []
+        self._all_sources: List[List[str]] = []
+        self._findings_text: List[str] = []
+        for finding in findings:
+            self.add_finding(finding)
+
+    def add_finding(self, finding: dict) -> None:
+        """Fold a finding into the citation prompt as soon as it is available."""
+        self.findings.append(finding)
+        idx = len(self.findings)
+        summary = finding.get("summary", "")
+        sources = finding.get("sources", [])
+        self._all_sources.append(sources)
+        
+        if summary:
+            self._findings_text.append(f"Finding {idx}: {summary}")
+        
+        if sources:
+            self._findings_text.append(f"Sources: {', '.join(dict.fromkeys(sources))}")
 
     def _extract_urls_from_sources(self, sources: List[str]) -> List[str]:
         """Extract URLs from source strings."""
-        urls = []
-        url_pattern = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+')
-        for source in sources:
-            found_urls = url_pattern.findall(source)
-            urls.extend(found_urls)
-        return urls
+        return [url for source in sources for url in _URL_RE.findall(source)]
 
     def _format_citations(self, report: str, sources: List[List[str]]) -> tuple[str, List[dict]]:
         """Format citations and create citation entries."""
-        citations = []
-        formatted_report = report
-        
-        # Process each finding's sources
-        citation_counter = 1
+        # Each distinct URL gets exactly one citation number, in first-seen order
+        url_to_idx: dict[str, int] = {}
         for finding_sources in sources:
-            urls = self._extract_urls_from_sources(finding_sources)
-            for url in urls:
-                # Create citation entry
-                citation_text = f"[{citation_counter}]"
-                citations.append({
-                    "citation": f"Source {citation_counter}",
-                    "url": url
-                })
-                
-                # Add citation marker to report (if not already present)
-                if citation_text not in formatted_report:
-                    # Add citation at the end of relevant sentences or paragraphs
-                    formatted_report += f" {citation_text}"
-                
-                citation_counter += 1
+            for url in self._extract_urls_from_sources(finding_sources):
+                url_to_idx.setdefault(url, len(url_to_idx) + 1)
+        
+        citations = [{"citation": f"Source {idx}", "url": url} for url, idx in url_to_idx.items()]
         
-        return formatted_report, citations
+        # Add citation markers to report (if not already present)
+        existing_markers = set(_MARKER_RE.findall(report))
+        report_parts = [report]
+        report_parts.extend(
+            marker for marker in (f"[{idx}]" for idx in url_to_idx.values()) if marker not in existing_markers
+        )
+        
+        return " ".join(report_parts), citations
 
     async def run(self) -> Any:
         await self.register(brief="Attach citations to synthesized report")
         await self.mark_status(AgentStatus.RUNNING)
-        
-        # Collect all findings and sources
-        all_sources = []
-        findings_text = []
-        
-        for idx, finding in enumerate(self.findings, start=1):
-            summary = finding.get("summary", "")
-            sources = finding.get("sources", [])
-            all_sources.append(sources)
-            
-            if summary:
-                findings_text.append(f"Finding {idx}: {summary}")
-            
-            if sources:
-                findings_text.append(f"Sources: {', '.join(sources)}")
-
-        # Create comprehensive prompt for citation generation
-        prompt_lines = [
-            "You are a research citation specialist. Your task is to:",
-            "1. Synthesize the research findings into a coherent report",
-            "2. Add proper citations with source URLs",
-            "3. Format the output as JSON with 'report' and 'citations' keys",
-            "",
-            "Research Findings:",
-            *findings_text,
-            "",
-            "Instructions:",
-            "- Create a comprehensive research report based on the findings",
-            "- Include inline citations like [1], [2], etc. in the report",
-            "- List all sources with their URLs in the citations array",
-            "- Make sure each citation has both 'citation' text and 'url' if available",
-            "",
-            "Output format:",
-            '{"report": "Your synthesized report with [1], [2] citations...", "citations": [{"citation": "Source 1", "url": "https://example.com"}, ...]}'
-        ]
-        
-        response = await self.plan_with_llm("\n".join(prompt_lines))
+        return await self._synthesize()
+
+    async def run_streaming(self, findings: asyncio.Queue[Optional[dict]]) -> Any:
+        """Consume findings from a queue until a ``None`` sentinel, then synthesize the report."""
+        await self.register(brief="Attach citations to synthesized report")
+        await self.mark_status(AgentStatus.RUNNING)
+        while (finding := await findings.get()) is not None:
+            self.add_finding(finding)
+        return await self._synthesize()
+
+    async def _generate_with_llm(self) -> dict:
+        response = await self.plan_with_llm(
+            prompt="\n".join(["Research Findings:", *self._findings_text]),
+            system_prompt=CITATION_SYSTEM_PROMPT,
+            cacheable_system=True,
+        )
         
         # Parse the LLM response and ensure proper format
-        try:
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                citation_data = json.loads(json_match.group())
-            else:
-                # Fallback: create basic citation structure
-                citation_data = {
-                    "report": response,
-                    "citations": []
-                }
-        except (json.JSONDecodeError, AttributeError):
-            # If JSON parsing fails, create structured output manually
-            formatted_report, citations = self._format_citations(response, all_sources)
-            citation_data = {
-                "report": formatted_report,
-                "citations": citations
+        # A nested citation object is not a reply, e.g. when the report was cut off at max_tokens.
+        parsed = find_json_object(response, ("report",))
+        if parsed is not None:
+            return parsed
+        if "{" not in response:
+            # Fallback: create basic citation structure
+            return {
+                "report": response,
+                "citations": []
             }
+        # If JSON parsing fails, create structured output manually
+        formatted_report, citations = self._format_citations(response, self._all_sources)
+        return {
+            "report": formatted_report,
+            "citations": citations
+        }
+
+    async def _synthesize(self) -> Any:
+        summaries = [finding["summary"] for finding in self.findings if finding.get("summary")]
+        if not summaries:
+            citation_data: dict = {"report": "", "citations": []}
+        elif not any(self._all_sources):
+            # Nothing to cite, so skip the LLM round trip and report the summaries as-is
+            citation_data = {"report": "\n\n".join(summaries), "citations": []}
+        else:
+            citation_data = await self._generate_with_llm()
         
         # Ensure citations array exists and has proper format
         if "citations" not in citation_data:
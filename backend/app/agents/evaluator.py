@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
-import re
 from typing import Any, Dict, Optional
 
 from app.agents.base import BaseAgent
 from app.models.enums import AgentRole, AgentStatus, EventType
+from app.utils import fastjson
+from app.utils.json_parser import find_json_object
 
 EVALUATION_PROMPT = """
 You are an impartial evaluation judge for research reports.
@@ -57,31 +57,25 @@ class EvaluationAgent(BaseAgent):
         }
 
     @staticmethod
-    def _normalise_scores(scores: Dict[str, Any]) -> Dict[str, float]:
-        normalised: Dict[str, float] = {}
-        for key, value in scores.items():
-            try:
-                score = float(value)
-            except (TypeError, ValueError):
-                score = 0.0
-            normalised[key] = max(0.0, min(1.0, score))
-        return normalised
+    def _safe_float(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+    @classmethod
+    def _normalise_scores(cls, scores: Dict[str, Any]) -> Dict[str, float]:
+        safe_float = cls._safe_float
+        return {key: max(0.0, min(1.0, safe_float(value))) for key, value in scores.items()}
 
     def _parse_response(self, raw_response: str) -> Dict[str, Any]:
         candidate: Optional[Dict[str, Any]] = None
         try:
-            parsed = json.loads(raw_response)
+            parsed = fastjson.loads(raw_response)
             if isinstance(parsed, dict):
                 candidate = parsed
-        except json.JSONDecodeError:
-            match = re.search(r"\{.*\}", raw_response, re.DOTALL)
-            if match:
-                try:
-                    parsed = json.loads(match.group())
-                    if isinstance(parsed, dict):
-                        candidate = parsed
-                except json.JSONDecodeError:
-                    candidate = None
+        except fastjson.JSONDecodeError:
+            candidate = find_json_object(raw_response, ("rubric_scores", "overall_score"))
 
         if candidate is None:
             return self._default_payload(raw_response)
@@ -128,16 +122,20 @@ class EvaluationAgent(BaseAgent):
             "report": self.report,
             "citations": self.citations,
         }
-        prompt_payload = json.dumps(evaluation_input, ensure_ascii=False, indent=2)
+        # Compact output keeps the judge prompt (and its token count) small
+        payload_bytes = fastjson.dumps_bytes(evaluation_input)
+        input_bytes = len(payload_bytes)
+        prompt_payload = payload_bytes.decode("utf-8")
 
         raw_response = await self.plan_with_llm(
             prompt=f"Research Output to evaluate:\n{prompt_payload}",
             system_prompt=EVALUATION_PROMPT,
+            cacheable_system=True,
         )
 
         await self.emit_event(
             EventType.TOOL_CALL,
-            {"tool": "llm_judge", "input_bytes": len(prompt_payload.encode("utf-8"))},
+            {"tool": "llm_judge", "input_bytes": input_bytes},
         )
 
         parsed = self._parse_response(raw_response)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from typing import Any, Optional
 
 from app.agents.base import BaseAgent
 from app.agents.citation import CitationAgent
@@ -22,12 +23,24 @@ class LeadResearcherAgent(BaseAgent):
         self.query = query
         self.goal = goal
 
+    @staticmethod
+    async def _run_subagent(agent: ResearchSubagent) -> Optional[Any]:
+        """Run a subagent, recording failures instead of cancelling its siblings."""
+
+        try:
+            return await agent.run()
+        except Exception as exc:  # noqa: BLE001 - one failed subagent shouldn't abort the run
+            await agent.mark_status(AgentStatus.FAILED, error=str(exc))
+            await agent.emit_event(EventType.AGENT_FAILED, {"error": str(exc)})
+            return None
+
     async def run(self) -> None:
         await self.register(brief=f"Investigate: {self.query}")
         await self.mark_status(AgentStatus.RUNNING)
         await run_store.update_run_status(self.run_id, RunStatus.RUNNING)
         await self.emit_event(EventType.RUN_STARTED, {"query": self.query, "goal": self.goal})
 
+        pending_tasks: list[asyncio.Task[Any]] = []
         try:
             plan_prompt = (
                 "You orchestrate multiple research subagents. Produce a structured plan "
@@ -44,29 +57,37 @@ class LeadResearcherAgent(BaseAgent):
             if not tasks:
                 tasks = [self.query]
 
-            subagents = [ResearchSubagent(self.run_id, task, self.query) for task in tasks[:3]]
-            subagent_outputs = []
-            for agent in subagents:
-                result = await agent.run()
-                subagent_outputs.append(result)
-
+            # The plan summary only depends on the tasks, so start it alongside the subagents
             summary_prompt = "Summarize key findings from the research plan, highlighting distinct angles and open questions."
-            summary = await self.plan_with_llm(
-                prompt="\n".join(agent_task for agent_task in tasks),
-                system_prompt=summary_prompt,
+            summary_task = asyncio.create_task(
+                self.plan_with_llm(
+                    prompt="\n".join(agent_task for agent_task in tasks),
+                    system_prompt=summary_prompt,
+                )
             )
+            pending_tasks.append(summary_task)
+
+            subagents = [ResearchSubagent(self.run_id, task, self.query) for task in tasks[:3]]
+
+            # Stream findings to the citation agent as each subagent finishes
+            findings_queue: asyncio.Queue[Optional[dict]] = asyncio.Queue(maxsize=len(subagents) + 1)
+            citation_agent = CitationAgent(self.run_id)
+            citation_task = asyncio.create_task(citation_agent.run_streaming(findings_queue))
+            pending_tasks.append(citation_task)
 
             # Prepare enhanced findings with better source information for citation agent
-            enhanced_findings = []
-            for output in subagent_outputs:
+            subagent_tasks = [asyncio.create_task(self._run_subagent(agent)) for agent in subagents]
+            pending_tasks.extend(subagent_tasks)
+            for next_output in asyncio.as_completed(subagent_tasks):
+                output = await next_output
                 if isinstance(output, dict):
-                    enhanced_findings.append({
+                    await findings_queue.put({
                         "summary": output.get("summary", ""),
                         "sources": output.get("sources", [])
                     })
+            await findings_queue.put(None)
 
-            citation_agent = CitationAgent(self.run_id, enhanced_findings)
-            citations_response = await citation_agent.run()
+            summary, citations_response = await asyncio.gather(summary_task, citation_task)
 
             # Ensure proper JSON extraction and validation
             if isinstance(citations_response, dict):
@@ -75,22 +96,15 @@ class LeadResearcherAgent(BaseAgent):
                 citation_payload = extract_json(citations_response) if isinstance(citations_response, str) else {"report": "", "citations": []}
 
             # Extract and validate citation data
-            final_report = citation_payload.get("report", summary)
+            # An empty report (e.g. every subagent failed) falls back to the plan summary
+            final_report = citation_payload.get("report") or summary
             final_citations = citation_payload.get("citations", [])
 
-            # Ensure citations are in the correct format
-            formatted_citations = []
-            for citation in final_citations:
-                if isinstance(citation, dict):
-                    formatted_citations.append({
-                        "citation": citation.get("citation", ""),
-                        "url": citation.get("url", "")
-                    })
-
-            await run_store.save_final_report(
+            # The store normalises citations into {"citation", "url"} entries
+            formatted_citations = await run_store.save_final_report(
                 self.run_id,
                 report=final_report,
-                citations=formatted_citations,
+                citations=final_citations,
             )
 
             evaluation_payload = None
@@ -137,3 +151,8 @@ class LeadResearcherAgent(BaseAgent):
             await self.mark_status(AgentStatus.FAILED, error=str(exc))
             await self.emit_event(EventType.RUN_FAILED, {"error": str(exc)})
             raise
+        finally:
+            # Also runs when the lead itself is cancelled, so the citation agent isn't left
+            # waiting on the findings queue and subagents don't outlive the run.
+            for task in pending_tasks:
+                task.cancel()
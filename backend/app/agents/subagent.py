@@ -2,11 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 from app.agents.base import BaseAgent
 from app.models.enums import AgentRole, AgentStatus, EventType
-from app.tools.search import SearchTool
+from app.tools.search import SearchResult, get_search_tool
+
+SUBAGENT_SYSTEM_PROMPT = (
+    "You are a specialized research subagent. "
+    "Synthesize a concise bullet summary of the evidence for your task, referencing top sources."
+)
+
+
+def _select_evidence(results: Sequence[SearchResult], max_results: int) -> list[SearchResult]:
+    """Drop results with a URL already seen and keep at most max_results."""
+    seen: set[str] = set()
+    selected = []
+    for res in results:
+        if res.url in seen:
+            continue
+        seen.add(res.url)
+        selected.append(res)
+        if len(selected) >= max_results:
+            break
+    return selected
+
+
+def _build_research_prompt(task: str, query: str, results: Sequence[SearchResult], max_snippet_chars: int) -> str:
+    evidence = "\n".join(["- " + res.title + ": " + res.snippet[:max_snippet_chars] for res in results])
+    return f"Task: {task}\nOverall query: {query}\nEvidence:\n{evidence}"
 
 
 class ResearchSubagent(BaseAgent):
@@ -16,27 +40,23 @@ class ResearchSubagent(BaseAgent):
         super().__init__(run_id, name=f"Subagent: {task[:24]}", role=AgentRole.SUBAGENT)
         self.task = task
         self.query = query
-        self.search = SearchTool()
+        self.search = get_search_tool()
 
     async def run(self) -> Any:
         await self.register(brief=self.task)
         await self.mark_status(AgentStatus.RUNNING)
-        search_results = await self.search.search(self.task)
-        research_prompt = (
-            "You are a specialized research subagent."
-            "\nTask: {task}\nOverall query: {query}\n"
-            "Evidence:\n{evidence}\n"
-            "Synthesize a concise bullet summary referencing top sources."
-        ).format(
-            task=self.task,
-            query=self.query,
-            evidence="\n".join(f"- {res.title}: {res.snippet}" for res in search_results),
+        settings = self.llm._settings
+        max_results = settings.max_evidence_results
+        search_results = _select_evidence(await self.search.search(self.task, limit=max_results), max_results)
+        research_prompt = _build_research_prompt(
+            self.task, self.query, search_results, settings.max_evidence_chars
         )
-        result = await self.plan_with_llm(research_prompt)
+        result = await self.plan_with_llm(research_prompt, system_prompt=SUBAGENT_SYSTEM_PROMPT)
         await self.record_finding(result)
+        sources = [res.url for res in search_results]
         await self.emit_event(
             EventType.AGENT_COMPLETED,
-            {"result": result, "sources": [res.url for res in search_results]},
+            {"result": result, "sources": sources},
         )
         await self.mark_status(AgentStatus.COMPLETED)
-        return {"summary": result, "sources": [res.url for res in search_results]}
+        return {"summary": result, "sources": sources}
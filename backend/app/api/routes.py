@@ -3,22 +3,47 @@
 from __future__ import annotations
 
 from typing import List, Optional
-from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, BackgroundTasks, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.agents.lead_researcher import LeadResearcherAgent
-from app.core.settings import Settings, get_settings
-from app.models.enums import EventType, RunStatus
-from app.models.events import RunEvent
+from app.models.enums import RUN_STATUS_VALUES, EventType, RunStatus
+from app.models.events import RunEvent, serialize_event
 from app.models.run import ResearchRun
 from app.services.event_bus import event_bus
 from app.services.run_store import run_store
+from app.utils import fastjson
 
 router = APIRouter(prefix="/api", tags=["research"])
 
 
+def _event_id_key(event_id: str) -> tuple[int, ...]:
+    # Redis stream IDs ("<ms>-<seq>") and in-memory sequence numbers both order part by part.
+    return tuple(int(part) for part in event_id.split("-"))
+
+
+def _skip_replayed(frame: str, cursor: tuple[int, ...]) -> tuple[Optional[str], bool]:
+    """Drop events already sent in the history frame from a live frame.
+
+    Returns the frame to send (None when nothing is left) and whether it carried a stored
+    event newer than the history, after which no further filtering is needed.
+    """
+
+    data = fastjson.loads(frame)
+    events = data["events"] if data.get("type") == "batch" else [data]
+    fresh = [event for event in events if event.get("id") is None or _event_id_key(event["id"]) > cursor]
+    caught_up = any(event.get("id") is not None for event in fresh)
+    if len(fresh) == len(events):
+        return frame, caught_up
+    if not fresh:
+        return None, False
+    if len(fresh) == 1:
+        return fastjson.dumps(fresh[0]), caught_up
+    return fastjson.dumps({"type": "batch", "events": fresh}), caught_up
+
+
 class CitationResponse(BaseModel):
     """Citation data structure for API responses."""
     citation: str
@@ -37,23 +62,10 @@ class RunSummaryResponse(BaseModel):
     evaluation: Optional[dict] = None
 
 
-BEIJING_TZ = ZoneInfo("Asia/Shanghai")
-
-
-def format_beijing(timestamp):
-    if timestamp is None:
-        return None
-    try:
-        return timestamp.astimezone(BEIJING_TZ).isoformat()
-    except AttributeError:
-        return str(timestamp)
-
-
 @router.post("/runs", response_model=dict)
 async def create_run(
     payload: dict,
     background_tasks: BackgroundTasks,
-    settings: Settings = Depends(get_settings),
 ) -> dict:
     query = payload.get("query")
     goal = payload.get("goal")
@@ -82,19 +94,10 @@ async def create_run(
 
 
 @router.get("/runs/{run_id}", response_model=RunSummaryResponse)
-async def get_run(run_id: str) -> RunSummaryResponse:
+async def get_run(run_id: str) -> ORJSONResponse:
     run = await run_store.get_run(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    
-    # Format citations properly for frontend
-    formatted_citations = []
-    for citation in run.citations:
-        if isinstance(citation, dict):
-            formatted_citations.append(CitationResponse(
-                citation=citation.get("citation", ""),
-                url=citation.get("url")
-            ))
 
     evaluation_payload = None
     if run.evaluation:
@@ -105,30 +108,28 @@ async def get_run(run_id: str) -> RunSummaryResponse:
             "feedback": run.evaluation.feedback,
         }
 
-    return RunSummaryResponse(
-        id=run.id,
-        query=run.query,
-        goal=run.goal,
-        status=run.status.value,
-        plan=run.plan,
-        final_report=run.final_report,
-        citations=formatted_citations,
-        evaluation=evaluation_payload,
+    # RunSummaryResponse only documents the schema; the fields are already in wire form,
+    # so encode the dict directly instead of validating and re-serialising a model.
+    return ORJSONResponse(
+        content={
+            "id": run.id,
+            "query": run.query,
+            "goal": run.goal,
+            "status": RUN_STATUS_VALUES[run.status],
+            "plan": run.plan,
+            "final_report": run.final_report,
+            # Already normalised by RunStore.save_final_report
+            "citations": run.citations,
+            "evaluation": evaluation_payload,
+        }
     )
 
 
 @router.get("/runs/{run_id}/events", response_model=List[dict])
-async def get_run_events(run_id: str) -> List[dict]:
+async def get_run_events(run_id: str) -> ORJSONResponse:
     events = await run_store.get_events(run_id)
-    return [
-        {
-            "type": event.type.value,
-            "timestamp": format_beijing(event.timestamp),
-            "payload": event.payload,
-            "agent_id": event.agent_id,
-        }
-        for event in events
-    ]
+    # Returning the response directly skips response_model re-validation of every event.
+    return ORJSONResponse(content=[serialize_event(event) for event in events])
 
 
 @router.websocket("/ws/runs/{run_id}")
@@ -139,56 +140,33 @@ async def run_events_ws(websocket: WebSocket, run_id: str) -> None:
         return
 
     await websocket.accept()
-    queue = await event_bus.subscribe(run_id)
+    subscription = await event_bus.subscribe(run_id)
     try:
-        await websocket.send_json({"type": "run_state", "status": run.status.value})
-        # Send replay of existing events for late subscribers
+        await websocket.send_text(fastjson.dumps({"type": "run_state", "status": RUN_STATUS_VALUES[run.status]}))
+        # Send replay of existing events for late subscribers as a single frame
         history = await run_store.get_events(run_id)
-        for event in history:
-            await websocket.send_json(
-                {
-                    "type": event.type.value,
-                    "timestamp": format_beijing(event.timestamp),
-                    "payload": event.payload,
-                    "agent_id": event.agent_id,
-                }
+        cursor: Optional[tuple[int, ...]] = None
+        if history:
+            await websocket.send_text(
+                fastjson.dumps({"type": "history", "events": [serialize_event(event) for event in history]})
             )
+            # Events stored after subscribing but before the history read arrive live as well.
+            cursor = _event_id_key(history[-1].id)
 
         while True:
-            event = await queue.get()
-            
-            # Handle special formatting for citation events
-            if event.type.value == "citations_generated":
-                payload = event.payload.copy()
-                # Ensure citations are properly formatted
-                if "citations" in payload:
-                    formatted_citations = []
-                    for citation in payload["citations"]:
-                        if isinstance(citation, dict):
-                            formatted_citations.append({
-                                "citation": citation.get("citation", ""),
-                                "url": citation.get("url", "")
-                            })
-                    payload["citations"] = formatted_citations
-                
-                await websocket.send_json(
-                    {
-                        "type": event.type.value,
-                        "timestamp": format_beijing(event.timestamp),
-                        "payload": payload,
-                        "agent_id": event.agent_id,
-                    }
-                )
-            else:
-                await websocket.send_json(
-                    {
-                        "type": event.type.value,
-                        "timestamp": format_beijing(event.timestamp),
-                        "payload": event.payload,
-                        "agent_id": event.agent_id,
-                    }
-                )
+            frame = await subscription.queue.get()
+            if subscription.lagging:
+                # The bus dropped this subscriber after its queue overflowed; tell the client.
+                await websocket.close(code=1011, reason="Subscriber lagging behind event stream")
+                break
+            if cursor is not None:
+                frame, caught_up = _skip_replayed(frame, cursor)
+                if caught_up:
+                    cursor = None
+                if frame is None:
+                    continue
+            await websocket.send_text(frame)
     except WebSocketDisconnect:
         pass
     finally:
-        await event_bus.unsubscribe(run_id, queue)
+        await event_bus.unsubscribe(run_id, subscription)
@@ -59,6 +59,30 @@ class Settings(BaseSettings):
         description="Max response tokens for primary LLM calls.",
     )
 
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse completions for byte-identical prompts instead of calling the LLM again.",
+    )
+    llm_cache_ttl_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        description="How long (in seconds) a cached LLM completion stays valid.",
+    )
+    llm_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum number of LLM completions kept in the prompt cache.",
+    )
+    llm_stream_tokens: bool = Field(
+        default=True,
+        description="Forward streamed LLM tokens to live WebSocket subscribers as llm_token events.",
+    )
+    llm_prompt_cache_control: bool = Field(
+        default=False,
+        alias="LLM_PROMPT_CACHE_CONTROL",
+        description="Mark static system prompts with cache_control blocks for providers that support prompt caching.",
+    )
+
     # Backend runtime configuration
     run_retention_minutes: int = Field(
         default=120,
@@ -70,6 +94,16 @@ class Settings(BaseSettings):
         ge=1,
         description="Maximum parallel subagents spawned by the lead agent as guided by the article heuristics.",
     )
+    max_evidence_results: int = Field(
+        default=6,
+        ge=1,
+        description="Maximum distinct search results a subagent includes as evidence in its prompt.",
+    )
+    max_evidence_chars: int = Field(
+        default=240,
+        ge=1,
+        description="Maximum characters of each search snippet included in a subagent prompt.",
+    )
     event_buffer_size: int = Field(
         default=1000,
         ge=100,
@@ -83,6 +117,26 @@ class Settings(BaseSettings):
         default=None,
         description="Optional path to JSON/CSV fixtures used by offline research simulations.",
     )
+    redis_url: Optional[str] = Field(
+        default=None,
+        alias="REDIS_URL",
+        description="Redis URL for sharing runs and events across workers; the in-memory store is used when unset.",
+    )
+    search_cache_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        description="How long (in seconds) cached Tavily results for a query stay valid.",
+    )
+    search_cache_negative_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="How long (in seconds) a query that returned no Tavily results is remembered as empty.",
+    )
+    search_cache_max_entries: int = Field(
+        default=512,
+        ge=1,
+        description="Maximum number of distinct search queries kept in the search cache.",
+    )
     tavily_api_key: str = Field(
         alias="TAVILY_API_KEY",
         default="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",
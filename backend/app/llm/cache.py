@@ -0,0 +1,53 @@
+"""In-memory cache for LLM completions keyed on the exact prompt."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+from app.core.settings import get_settings
+
+
+class PromptCache:
+    """TTL + LRU cache mapping (system prompt, prompt, model) to a completion."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @staticmethod
+    def make_key(prompt: str, system_prompt: Optional[str], model: Optional[str]) -> str:
+        raw = "\x00".join((system_prompt or "", prompt, model or ""))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_prompt_cache() -> PromptCache:
+    """Return the process-wide prompt cache configured from settings."""
+
+    settings = get_settings()
+    return PromptCache(
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        max_entries=settings.llm_cache_max_entries,
+    )
@@ -3,64 +3,196 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Optional
+import random
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Optional
 
 import httpx
 from fastapi import HTTPException
 
 from app.core.settings import Settings, get_settings
+from app.utils import fastjson
+
+
+# Transport-level retries: full-jitter backoff capped per attempt and bounded by a total budget.
+TRANSPORT_RETRY_MAX_DELAY = 8.0
+TRANSPORT_RETRY_BUDGET_SECONDS = 10.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    if response.status_code not in (429, 503):
+        return None
+    retry_after = response.headers.get("retry-after")
+    if retry_after is None:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        # HTTP-date form; fall back to jittered backoff.
+        return None
+
+
+async def _sleep_before_retry(
+    attempt: int,
+    deadline: float,
+    response: Optional[httpx.Response] = None,
+) -> bool:
+    """Sleep before the next attempt; return False if that would overrun the retry budget."""
+
+    delay = _retry_after_seconds(response) if response is not None else None
+    if delay is None:
+        delay = random.uniform(0, min(TRANSPORT_RETRY_MAX_DELAY, 2**attempt))
+    loop = asyncio.get_running_loop()
+    if loop.time() + delay > deadline:
+        return False
+    await asyncio.sleep(delay)
+    return True
+
+
+def _build_http_client(settings: Settings) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        # HTTP/2 multiplexes concurrent agent requests over a single connection.
+        http2=True,
+        base_url=str(settings.openai_base_url),
+        headers={
+            "Authorization": f"Bearer {settings.openai_api_key}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+        # Sized for the lead agent plus parallel subagents sharing one client.
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.AsyncClient:
+    return _build_http_client(get_settings())
+
+
+async def close_shared_http_client() -> None:
+    """Close the process-wide HTTP client; called on application shutdown."""
+
+    if _shared_http_client.cache_info().currsize:
+        await _shared_http_client().aclose()
+        _shared_http_client.cache_clear()
 
 
 class LLMClient:
-    """Thin async client handling auth, retries, and future streaming support."""
+    """Thin async client for streamed chat completions with auth and transport-level retries."""
 
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self._settings = settings or get_settings()
-        self._client = httpx.AsyncClient(
-            base_url=str(self._settings.openai_base_url),
-            headers={
-                "Authorization": f"Bearer {self._settings.openai_api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
+        # Only clients built for explicit settings own their connection pool.
+        self._own_client = _build_http_client(self._settings) if settings is not None else None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        # The shared pool is looked up per request so a long-lived LLMClient picks up a fresh
+        # one after close_shared_http_client() instead of holding on to the closed client.
+        return self._own_client if self._own_client is not None else _shared_http_client()
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._own_client is not None:
+            await self._own_client.aclose()
 
-    async def complete(
+    def _build_payload(
         self,
         prompt: str,
-        model: Optional[str] = None,
-        temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None,
-        system_prompt: Optional[str] = None,
-    ) -> str:
-        payload: Dict[str, Any] = {
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        system_prompt: Optional[str],
+        cacheable_system: bool,
+    ) -> Dict[str, Any]:
+        system_content: Any = system_prompt or "You are a helpful research agent."
+        if cacheable_system and self._settings.llm_prompt_cache_control:
+            # Anthropic-style cache breakpoint so the provider reuses the prefilled system prompt.
+            system_content = [{"type": "text", "text": system_content, "cache_control": {"type": "ephemeral"}}]
+
+        return {
             "model": model or self._settings.openai_model,
             "temperature": temperature or self._settings.openai_temperature,
             "max_tokens": max_tokens or self._settings.max_tokens,
             "messages": [
-                {"role": "system", "content": system_prompt or "You are a helpful research agent."},
+                {"role": "system", "content": system_content},
                 {"role": "user", "content": prompt},
             ],
         }
 
+    async def complete(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        cacheable_system: bool = False,
+    ) -> str:
+        chunks = [
+            chunk
+            async for chunk in self.stream(
+                prompt,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system_prompt,
+                cacheable_system=cacheable_system,
+            )
+        ]
+        return "".join(chunks)
+
+    async def stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        cacheable_system: bool = False,
+    ) -> AsyncIterator[str]:
+        """Yield content deltas from a streaming chat completion as they arrive."""
+
+        payload = self._build_payload(prompt, model, temperature, max_tokens, system_prompt, cacheable_system)
+        payload["stream"] = True
+        # Encode once with orjson; the shared client already sends the JSON Content-Type header.
+        body = fastjson.dumps_bytes(payload)
+
+        deadline = asyncio.get_running_loop().time() + TRANSPORT_RETRY_BUDGET_SECONDS
         for attempt in range(3):
+            # Once tokens have reached the caller a retry would duplicate them, so only retry before that.
+            streamed = False
             try:
-                response = await self._client.post("/chat/completions", json=payload)
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+                async with self._client.stream("POST", "/chat/completions", content=body) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            return
+                        choices = fastjson.loads(data).get("choices") or []
+                        content = (choices[0].get("delta") or {}).get("content") if choices else None
+                        if content:
+                            streamed = True
+                            yield content
+                return
             except httpx.HTTPStatusError as exc:
-                if exc.response.status_code >= 500 and attempt < 2:
-                    await asyncio.sleep(2**attempt)
-                    continue
+                status_code = exc.response.status_code
+                if (status_code >= 500 or status_code == 429) and attempt < 2 and not streamed:
+                    if await _sleep_before_retry(attempt, deadline, exc.response):
+                        continue
                 raise HTTPException(status_code=502, detail="LLM upstream error") from exc
             except httpx.RequestError as exc:
-                if attempt < 2:
-                    await asyncio.sleep(2**attempt)
-                    continue
+                if attempt < 2 and not streamed:
+                    if await _sleep_before_retry(attempt, deadline):
+                        continue
                 raise HTTPException(status_code=504, detail="LLM request failed") from exc
 
         raise HTTPException(status_code=500, detail="LLM request exhausted retries")
+
+
+@lru_cache(maxsize=1)
+def get_llm_client() -> LLMClient:
+    """Return a process-wide LLMClient so all agents share one connection pool."""
+
+    return LLMClient()
@@ -1,13 +1,28 @@
 """FastAPI entrypoint for the multi-agent research demo backend."""
 
-from fastapi import Depends, FastAPI
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.routes import router as api_router
-from app.core.settings import Settings, get_settings
+from app.core.settings import get_settings
+from app.llm.client import close_shared_http_client
+from app.tools.search import close_search_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Shared HTTP pools are closed on shutdown and rebuilt lazily on the next startup.
+    await close_shared_http_client()
+    await close_search_client()
 
-app = FastAPI(title="Multi-Agent Research Demo")
+
+app = FastAPI(title="Multi-Agent Research Demo", default_response_class=ORJSONResponse, lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -31,12 +46,17 @@ app.mount(
 )
 
 
+# Settings are fixed for the process lifetime, so the health payload is built once.
+_settings = get_settings()
+APP_INFO = {
+    "status": "ok",
+    "app": _settings.app_name,
+    "environment": _settings.environment,
+}
+
+
 @app.get("/health", tags=["system"])
-async def health(settings: Settings = Depends(get_settings)) -> dict[str, str]:
+async def health() -> dict[str, str]:
     """Simple health endpoint that ensures settings load successfully."""
 
-    return {
-        "status": "ok",
-        "app": settings.app_name,
-        "environment": settings.environment,
-    }
+    return APP_INFO
@@ -39,3 +39,8 @@ class EventType(str, Enum):
     CITATIONS_GENERATED = "citations_generated"
     EVALUATION_COMPLETED = "evaluation_completed"
     LLM_RETRY = "llm_retry"
+    LLM_TOKEN = "llm_token"
+
+
+# Precomputed wire values so hot serialization paths skip the Enum ``.value`` lookup.
+RUN_STATUS_VALUES = {status: status.value for status in RunStatus}
@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 
 from .enums import EventType
 
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -21,3 +22,25 @@ class RunEvent:
     timestamp: datetime = field(default_factory=_utc_now)
     payload: Dict[str, Any] = field(default_factory=dict)
     agent_id: Optional[str] = None
+    # Position in the run's stored history, assigned by the run store; None for live-only events.
+    id: Optional[str] = None
+    # Wire values cached at construction; serializers read them for every subscriber.
+    _type_str: str = field(init=False, repr=False, compare=False)
+    _epoch_us: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._type_str = self.type.value
+        # Clients format the timestamp themselves, so the wire carries UTC epoch microseconds.
+        self._epoch_us = int(self.timestamp.timestamp() * 1_000_000)
+
+
+def serialize_event(event: RunEvent) -> Dict[str, Any]:
+    """Build the wire representation of an event shared by REST and WebSocket clients."""
+
+    return {
+        "type": event._type_str,
+        "timestamp": event._epoch_us,
+        "payload": event.payload,
+        "agent_id": event.agent_id,
+        "id": event.id,
+    }
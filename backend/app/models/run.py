@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 from .enums import AgentRole, AgentStatus, RunStatus
+from .events import _utc_now
 
 
 @dataclass(slots=True)
@@ -43,8 +44,8 @@ class ResearchRun:
     query: str
     goal: Optional[str]
     status: RunStatus = RunStatus.CREATED
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utc_now)
+    updated_at: datetime = field(default_factory=_utc_now)
     agents: Dict[str, AgentState] = field(default_factory=dict)
     plan: Optional[str] = None
     final_report: Optional[str] = None
@@ -52,4 +53,4 @@ class ResearchRun:
     evaluation: Optional[EvaluationResult] = None
 
     def update_timestamp(self) -> None:
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _utc_now()
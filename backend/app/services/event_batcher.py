@@ -0,0 +1,56 @@
+"""Coalesces run events into bulk writes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+from app.models.events import RunEvent
+
+logger = logging.getLogger(__name__)
+
+
+class EventBatcher:
+    """Buffers RunEvent instances and flushes them in batches or after a short delay."""
+
+    def __init__(
+        self,
+        sink: Callable[[list[RunEvent]], Awaitable[None]],
+        max_batch: int = 32,
+        max_delay: float = 0.01,
+    ) -> None:
+        self._sink = sink
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._buffer: list[RunEvent] = []
+        self._flush_task: Optional[asyncio.Task[None]] = None
+        self._lock = asyncio.Lock()
+
+    async def put(self, event: RunEvent) -> None:
+        self._buffer.append(event)
+        if len(self._buffer) >= self._max_batch:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        try:
+            await self.flush()
+        except Exception:
+            # Nobody awaits this task; the batch is back in the buffer for the next flush.
+            logger.exception("Deferred event flush failed; %d events re-queued", len(self._buffer))
+
+    async def flush(self) -> None:
+        # Swapping the buffer under the lock keeps batches in emission order.
+        async with self._lock:
+            batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            try:
+                await self._sink(batch)
+            except Exception:
+                # Put the batch back ahead of anything buffered meanwhile so order is kept.
+                self._buffer[:0] = batch
+                raise
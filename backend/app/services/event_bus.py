@@ -3,43 +3,153 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from collections import defaultdict
-from typing import DefaultDict
+from dataclasses import dataclass, field
+from typing import DefaultDict, Optional
 
-from app.models.events import RunEvent
+from app.core.settings import get_settings
+from app.models.enums import EventType
+from app.models.events import RunEvent, serialize_event
+from app.utils import fastjson
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 200
+# Streamed tokens are coalesced per agent and published at most this often (seconds).
+TOKEN_FLUSH_INTERVAL = 0.05
+
+
+def _frame_queue() -> asyncio.Queue[str]:
+    return asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+
+@dataclass(slots=True, eq=False)
+class Subscription:
+    """A subscriber's bounded frame queue, flagged as lagging once it overflows."""
+
+    queue: asyncio.Queue[str] = field(default_factory=_frame_queue)
+    lagging: bool = False
+
+
+def group_by_run(events: list[RunEvent]) -> dict[str, list[RunEvent]]:
+    by_run: dict[str, list[RunEvent]] = {}
+    for event in events:
+        by_run.setdefault(event.run_id, []).append(event)
+    return by_run
+
+
+def encode_batch_frame(run_events: list[RunEvent]) -> str:
+    """Encode a run's events as a single frame (a plain event frame when there is only one)."""
+
+    if len(run_events) == 1:
+        return fastjson.dumps(serialize_event(run_events[0]))
+    return fastjson.dumps({"type": "batch", "events": [serialize_event(event) for event in run_events]})
 
 
 class EventBus:
-    """Simple in-memory pub/sub for broadcasting RunEvent instances."""
+    """Simple in-memory pub/sub broadcasting pre-serialized RunEvent frames.
+
+    Streamed llm_token deltas are coalesced per agent here for every backend; subclasses
+    only override the ``_publish_*`` hooks that deliver frames.
+    """
 
     def __init__(self) -> None:
-        self._subscribers: DefaultDict[str, set[asyncio.Queue[RunEvent]]] = defaultdict(set)
-        self._lock = asyncio.Lock()
-
-    async def subscribe(self, run_id: str) -> asyncio.Queue[RunEvent]:
-        queue: asyncio.Queue[RunEvent] = asyncio.Queue(maxsize=200)
-        async with self._lock:
-            self._subscribers[run_id].add(queue)
-        return queue
-
-    async def unsubscribe(self, run_id: str, queue: asyncio.Queue[RunEvent]) -> None:
-        async with self._lock:
-            queues = self._subscribers.get(run_id)
-            if not queues:
-                return
-            queues.discard(queue)
-            if not queues:
-                self._subscribers.pop(run_id, None)
+        self._subscribers: DefaultDict[str, set[Subscription]] = defaultdict(set)
+        self._pending_tokens: dict[tuple[str, Optional[str]], list[str]] = {}
+        self._token_flush: Optional[asyncio.Task[None]] = None
+
+    async def subscribe(self, run_id: str) -> Subscription:
+        subscription = Subscription()
+        self._subscribers[run_id].add(subscription)
+        return subscription
+
+    async def unsubscribe(self, run_id: str, subscription: Subscription) -> None:
+        subscriptions = self._subscribers.get(run_id)
+        if not subscriptions:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            self._subscribers.pop(run_id, None)
 
     async def publish(self, event: RunEvent) -> None:
-        async with self._lock:
-            subscribers = list(self._subscribers.get(event.run_id, set()))
-        for queue in subscribers:
+        if event.type is EventType.LLM_TOKEN:
+            # A frame per token would overflow slow subscribers' queues; deltas are buffered instead.
+            self._pending_tokens.setdefault((event.run_id, event.agent_id), []).append(event.payload["delta"])
+            if self._token_flush is None or self._token_flush.done():
+                self._token_flush = asyncio.create_task(self._flush_tokens_later())
+            return
+        await self._flush_tokens()
+        await self._publish_event(event)
+
+    async def publish_batch(self, events: list[RunEvent]) -> None:
+        """Publish events with one combined frame per run instead of one frame per event."""
+
+        # Buffered tokens go first so a tool_call never overtakes the output it settles.
+        await self._flush_tokens()
+        await self._publish_batch(events)
+
+    async def _flush_tokens_later(self) -> None:
+        await asyncio.sleep(TOKEN_FLUSH_INTERVAL)
+        try:
+            await self._flush_tokens()
+        except Exception:
+            # Tokens only feed the live preview; the settled output arrives with the tool_call.
+            logger.exception("Publishing coalesced LLM tokens failed")
+
+    async def _flush_tokens(self) -> None:
+        if not self._pending_tokens:
+            return
+        pending, self._pending_tokens = self._pending_tokens, {}
+        await self._publish_tokens(
+            [
+                RunEvent(run_id=run_id, type=EventType.LLM_TOKEN, agent_id=agent_id, payload={"delta": "".join(deltas)})
+                for (run_id, agent_id), deltas in pending.items()
+            ]
+        )
+
+    async def _publish_tokens(self, events: list[RunEvent]) -> None:
+        for event in events:
+            await self._publish_event(event)
+
+    async def _publish_event(self, event: RunEvent) -> None:
+        subscribers = self._subscribers.get(event.run_id)
+        if not subscribers:
+            return
+        # Serialize once and fan the same frame out to every subscriber.
+        self._fan_out(event.run_id, subscribers, fastjson.dumps(serialize_event(event)))
+
+    async def _publish_batch(self, events: list[RunEvent]) -> None:
+        for run_id, run_events in group_by_run(events).items():
+            subscribers = self._subscribers.get(run_id)
+            if not subscribers:
+                continue
+            self._fan_out(run_id, subscribers, encode_batch_frame(run_events))
+
+    def _fan_out(self, run_id: str, subscribers: set[Subscription], frame: str) -> None:
+        # put_nowait never yields, so the live set can be iterated without a copy; lagging
+        # subscribers are only removed once the loop is done.
+        lagging = []
+        for subscription in subscribers:
             try:
-                queue.put_nowait(event)
+                subscription.queue.put_nowait(frame)
             except asyncio.QueueFull:
-                _ = queue.get_nowait()
-                queue.put_nowait(event)
+                # A subscriber that can't keep up is dropped rather than silently losing events.
+                subscription.lagging = True
+                lagging.append(subscription)
+        if lagging:
+            subscribers.difference_update(lagging)
+            if not subscribers:
+                self._subscribers.pop(run_id, None)
+
+
+def _create_event_bus() -> EventBus:
+    settings = get_settings()
+    if settings.redis_url:
+        from app.services.redis_event_bus import RedisEventBus, get_redis
+
+        return RedisEventBus(get_redis(settings.redis_url))
+    return EventBus()
 
 
-event_bus = EventBus()
+event_bus = _create_event_bus()
@@ -0,0 +1,74 @@
+"""Redis pub/sub event bus so any worker can serve a run's WebSocket subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+from functools import lru_cache
+from typing import Any
+
+import redis.asyncio as redis
+
+from app.models.events import RunEvent, serialize_event
+from app.services.event_bus import EventBus, Subscription, encode_batch_frame, group_by_run
+from app.utils import fastjson
+
+
+@lru_cache(maxsize=1)
+def get_redis(url: str) -> redis.Redis:
+    """Return a process-wide Redis client for the given URL."""
+
+    return redis.from_url(url, decode_responses=True)
+
+
+def _channel(run_id: str) -> str:
+    return f"channel:events:{run_id}"
+
+
+class RedisEventBus(EventBus):
+    """EventBus fanning frames out through Redis pub/sub so any worker can serve a subscriber."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        super().__init__()
+        self._redis = client
+        self._listeners: dict[Subscription, asyncio.Task[None]] = {}
+
+    async def subscribe(self, run_id: str) -> Subscription:
+        subscription = Subscription()
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(_channel(run_id))
+        self._listeners[subscription] = asyncio.create_task(self._forward(pubsub, subscription))
+        return subscription
+
+    async def unsubscribe(self, run_id: str, subscription: Subscription) -> None:
+        listener = self._listeners.pop(subscription, None)
+        if listener is not None:
+            listener.cancel()
+
+    async def _forward(self, pubsub: Any, subscription: Subscription) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    subscription.queue.put_nowait(message["data"])
+                except asyncio.QueueFull:
+                    # Same contract as the in-memory bus: a subscriber that falls behind is dropped.
+                    subscription.lagging = True
+                    return
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def _publish_event(self, event: RunEvent) -> None:
+        await self._redis.publish(_channel(event.run_id), fastjson.dumps(serialize_event(event)))
+
+    async def _publish_batch(self, events: list[RunEvent]) -> None:
+        for run_id, run_events in group_by_run(events).items():
+            await self._redis.publish(_channel(run_id), encode_batch_frame(run_events))
+
+    async def _publish_tokens(self, events: list[RunEvent]) -> None:
+        # One round trip for every agent's coalesced tokens.
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.publish(_channel(event.run_id), fastjson.dumps(serialize_event(event)))
+            await pipe.execute()
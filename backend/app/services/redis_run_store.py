@@ -0,0 +1,214 @@
+"""Redis-backed run store so several workers can share run state and event history."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+from uuid import uuid4
+
+import redis.asyncio as redis
+
+from app.models.enums import AgentRole, AgentStatus, EventType, RunStatus
+from app.models.events import RunEvent, serialize_event
+from app.models.run import AgentState, EvaluationResult, ResearchRun
+from app.services.event_bus import event_bus
+from app.services.run_store import RunStore, normalise_citations
+from app.utils import fastjson
+
+
+def _run_key(run_id: str) -> str:
+    return f"run:{run_id}"
+
+
+def _agents_key(run_id: str) -> str:
+    return f"run:{run_id}:agents"
+
+
+def _events_key(run_id: str) -> str:
+    return f"events:{run_id}"
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _dump_agent(agent: AgentState) -> str:
+    return fastjson.dumps(asdict(agent))
+
+
+def _load_agent(raw: str) -> AgentState:
+    data = fastjson.loads(raw)
+    return AgentState(
+        id=data["id"],
+        name=data["name"],
+        role=AgentRole(data["role"]),
+        status=AgentStatus(data["status"]),
+        brief=data.get("brief"),
+        findings=data.get("findings", []),
+        started_at=_parse_datetime(data.get("started_at")),
+        completed_at=_parse_datetime(data.get("completed_at")),
+        error=data.get("error"),
+    )
+
+
+def _load_event(run_id: str, event_id: str, raw: str) -> RunEvent:
+    data = fastjson.loads(raw)
+    return RunEvent(
+        run_id=run_id,
+        type=EventType(data["type"]),
+        timestamp=datetime.fromtimestamp(data["timestamp"] / 1_000_000, tz=timezone.utc),
+        payload=data.get("payload") or {},
+        agent_id=data.get("agent_id"),
+        id=event_id,
+    )
+
+
+class RedisRunStore(RunStore):
+    """RunStore keeping runs in Redis hashes and events in Redis Streams.
+
+    Each run lives in ``run:{id}``, with every field JSON-encoded, and its agents live in
+    ``run:{id}:agents``. Events are appended to the ``events:{id}`` stream so late
+    subscribers on any worker can replay them with XRANGE.
+    """
+
+    def __init__(self, client: redis.Redis, retention_seconds: int) -> None:
+        super().__init__()
+        self._redis = client
+        self._retention_seconds = retention_seconds
+
+    def _touch(self, pipe: Any, run_id: str) -> None:
+        pipe.hset(_run_key(run_id), "updated_at", fastjson.dumps(datetime.now(timezone.utc)))
+        for key in (_run_key(run_id), _agents_key(run_id), _events_key(run_id)):
+            pipe.expire(key, self._retention_seconds)
+
+    async def _set_fields(self, run_id: str, **fields: Any) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hset(_run_key(run_id), mapping={name: fastjson.dumps(value) for name, value in fields.items()})
+            self._touch(pipe, run_id)
+            await pipe.execute()
+
+    async def create_run(self, query: str, goal: Optional[str] = None) -> ResearchRun:
+        run = ResearchRun(id=uuid4().hex, query=query, goal=goal)
+        await self._set_fields(
+            run.id,
+            query=run.query,
+            goal=run.goal,
+            status=run.status,
+            created_at=run.created_at,
+        )
+        return run
+
+    async def get_run(self, run_id: str) -> Optional[ResearchRun]:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(_run_key(run_id))
+            pipe.hgetall(_agents_key(run_id))
+            raw_run, raw_agents = await pipe.execute()
+        if not raw_run:
+            return None
+
+        data = {name: fastjson.loads(value) for name, value in raw_run.items()}
+        evaluation = data.get("evaluation")
+        return ResearchRun(
+            id=run_id,
+            query=data["query"],
+            goal=data.get("goal"),
+            status=RunStatus(data["status"]),
+            created_at=_parse_datetime(data.get("created_at")),
+            updated_at=_parse_datetime(data.get("updated_at")),
+            agents={agent_id: _load_agent(raw) for agent_id, raw in raw_agents.items()},
+            plan=data.get("plan"),
+            final_report=data.get("final_report"),
+            citations=data.get("citations") or [],
+            evaluation=EvaluationResult(**evaluation) if evaluation else None,
+        )
+
+    async def list_runs(self) -> Iterable[ResearchRun]:
+        # Scans the expiring run hashes rather than keeping a registry set that would never expire.
+        runs = []
+        async for key in self._redis.scan_iter(match=_run_key("*")):
+            run_id = key.split(":", 1)[1]
+            if ":" in run_id:
+                continue
+            run = await self.get_run(run_id)
+            if run is not None:
+                runs.append(run)
+        return runs
+
+    async def add_events_bulk(self, events: list[RunEvent]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for event in events:
+                pipe.xadd(_events_key(event.run_id), {"data": fastjson.dumps(serialize_event(event))})
+            # The stream IDs go out with the published frames so WebSocket replay can dedupe on them.
+            for event, event_id in zip(events, await pipe.execute()):
+                event.id = event_id
+        await event_bus.publish_batch(events)
+
+    async def get_events(self, run_id: str) -> list[RunEvent]:
+        entries = await self._redis.xrange(_events_key(run_id), "-", "+")
+        return [_load_event(run_id, event_id, fields["data"]) for event_id, fields in entries]
+
+    async def _get_agent(self, run_id: str, agent_id: str) -> AgentState:
+        raw = await self._redis.hget(_agents_key(run_id), agent_id)
+        if raw is None:
+            raise KeyError(agent_id)
+        return _load_agent(raw)
+
+    async def _save_agent(self, run_id: str, agent: AgentState) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hset(_agents_key(run_id), agent.id, _dump_agent(agent))
+            self._touch(pipe, run_id)
+            await pipe.execute()
+
+    async def add_agent(
+        self,
+        run_id: str,
+        name: str,
+        role: AgentRole,
+        brief: Optional[str] = None,
+    ) -> AgentState:
+        agent = AgentState(id=uuid4().hex, name=name, role=role, brief=brief)
+        await self._save_agent(run_id, agent)
+        return agent
+
+    async def update_agent_status(
+        self,
+        run_id: str,
+        agent_id: str,
+        status: AgentStatus,
+        error: Optional[str] = None,
+    ) -> None:
+        agent = await self._get_agent(run_id, agent_id)
+        agent.status = status
+        agent.error = error
+        await self._save_agent(run_id, agent)
+
+    async def append_finding(
+        self,
+        run_id: str,
+        agent_id: str,
+        finding: str,
+    ) -> None:
+        agent = await self._get_agent(run_id, agent_id)
+        agent.findings.append(finding)
+        agent.status = AgentStatus.RUNNING
+        await self._save_agent(run_id, agent)
+
+    async def update_run_status(self, run_id: str, status: RunStatus) -> None:
+        await self._set_fields(run_id, status=status)
+
+    async def save_plan(self, run_id: str, plan: str) -> None:
+        await self._set_fields(run_id, plan=plan)
+
+    async def save_final_report(
+        self,
+        run_id: str,
+        report: str,
+        citations: Optional[list[dict]] = None,
+    ) -> list[dict]:
+        normalised = normalise_citations(citations)
+        await self._set_fields(run_id, final_report=report, citations=normalised)
+        return normalised
+
+    async def save_evaluation(self, run_id: str, evaluation: EvaluationResult) -> None:
+        await self._set_fields(run_id, evaluation=asdict(evaluation))
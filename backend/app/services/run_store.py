@@ -2,51 +2,65 @@
 
 from __future__ import annotations
 
-import asyncio
 from typing import Dict, Iterable, Optional
 from uuid import uuid4
 
+from app.core.settings import get_settings
 from app.models.enums import AgentRole, AgentStatus, RunStatus
 from app.models.events import RunEvent
+from app.services.event_batcher import EventBatcher
 from app.services.event_bus import event_bus
 from app.models.run import AgentState, ResearchRun, EvaluationResult
 
 
+def normalise_citations(citations: Optional[list[dict]]) -> list[dict]:
+    """Normalise citations once on write so readers can pass them through untouched."""
+
+    return [
+        {"citation": citation.get("citation", ""), "url": citation.get("url", "")}
+        for citation in (citations or [])
+        if isinstance(citation, dict)
+    ]
+
+
 class RunStore:
     """Manages lifecycle of ResearchRun objects and their events."""
 
     def __init__(self) -> None:
+        # Only touched from the event loop and no mutation awaits midway, so no lock is needed.
         self._runs: Dict[str, ResearchRun] = {}
         self._events: Dict[str, list[RunEvent]] = {}
-        self._lock = asyncio.Lock()
+        self._batcher = EventBatcher(self.add_events_bulk)
 
     async def create_run(self, query: str, goal: Optional[str] = None) -> ResearchRun:
-        async with self._lock:
-            run_id = uuid4().hex
-            run = ResearchRun(id=run_id, query=query, goal=goal)
-            self._runs[run_id] = run
-            self._events[run_id] = []
-            return run
+        run_id = uuid4().hex
+        run = ResearchRun(id=run_id, query=query, goal=goal)
+        self._runs[run_id] = run
+        self._events[run_id] = []
+        return run
 
     async def get_run(self, run_id: str) -> Optional[ResearchRun]:
-        async with self._lock:
-            return self._runs.get(run_id)
+        return self._runs.get(run_id)
 
     async def list_runs(self) -> Iterable[ResearchRun]:
-        async with self._lock:
-            return list(self._runs.values())
+        return list(self._runs.values())
 
     async def add_event(self, event: RunEvent) -> None:
-        async with self._lock:
-            if event.run_id not in self._events:
-                self._events[event.run_id] = []
-            buffer = self._events[event.run_id]
-            buffer.append(event)
-        await event_bus.publish(event)
+        # Events are coalesced so each flush costs one buffer extend and one publish per run.
+        await self._batcher.put(event)
+
+    async def flush_events(self) -> None:
+        await self._batcher.flush()
+
+    async def add_events_bulk(self, events: list[RunEvent]) -> None:
+        for event in events:
+            run_events = self._events.setdefault(event.run_id, [])
+            run_events.append(event)
+            event.id = str(len(run_events))
+        await event_bus.publish_batch(events)
 
     async def get_events(self, run_id: str) -> list[RunEvent]:
-        async with self._lock:
-            return list(self._events.get(run_id, []))
+        return list(self._events.get(run_id, []))
 
     async def add_agent(
         self,
@@ -55,13 +69,12 @@ class RunStore:
         role: AgentRole,
         brief: Optional[str] = None,
     ) -> AgentState:
-        async with self._lock:
-            run = self._runs[run_id]
-            agent_id = uuid4().hex
-            agent = AgentState(id=agent_id, name=name, role=role, brief=brief)
-            run.agents[agent_id] = agent
-            run.update_timestamp()
-            return agent
+        run = self._runs[run_id]
+        agent_id = uuid4().hex
+        agent = AgentState(id=agent_id, name=name, role=role, brief=brief)
+        run.agents[agent_id] = agent
+        run.update_timestamp()
+        return agent
 
     async def update_agent_status(
         self,
@@ -70,12 +83,11 @@ class RunStore:
         status: AgentStatus,
         error: Optional[str] = None,
     ) -> None:
-        async with self._lock:
-            agent = self._runs[run_id].agents[agent_id]
-            agent.status = status
-            agent.error = error
-            run = self._runs[run_id]
-            run.update_timestamp()
+        agent = self._runs[run_id].agents[agent_id]
+        agent.status = status
+        agent.error = error
+        run = self._runs[run_id]
+        run.update_timestamp()
 
     async def append_finding(
         self,
@@ -83,42 +95,48 @@ class RunStore:
         agent_id: str,
         finding: str,
     ) -> None:
-        async with self._lock:
-            agent = self._runs[run_id].agents[agent_id]
-            agent.findings.append(finding)
-            agent.status = AgentStatus.RUNNING
-            run = self._runs[run_id]
-            run.update_timestamp()
+        agent = self._runs[run_id].agents[agent_id]
+        agent.findings.append(finding)
+        agent.status = AgentStatus.RUNNING
+        run = self._runs[run_id]
+        run.update_timestamp()
 
     async def update_run_status(self, run_id: str, status: RunStatus) -> None:
-        async with self._lock:
-            run = self._runs[run_id]
-            run.status = status
-            run.update_timestamp()
+        run = self._runs[run_id]
+        run.status = status
+        run.update_timestamp()
 
     async def save_plan(self, run_id: str, plan: str) -> None:
-        async with self._lock:
-            run = self._runs[run_id]
-            run.plan = plan
-            run.update_timestamp()
+        run = self._runs[run_id]
+        run.plan = plan
+        run.update_timestamp()
 
     async def save_final_report(
         self,
         run_id: str,
         report: str,
         citations: Optional[list[dict]] = None,
-    ) -> None:
-        async with self._lock:
-            run = self._runs[run_id]
-            run.final_report = report
-            run.citations = citations or []
-            run.update_timestamp()
+    ) -> list[dict]:
+        run = self._runs[run_id]
+        run.final_report = report
+        run.citations = normalise_citations(citations)
+        run.update_timestamp()
+        return run.citations
 
     async def save_evaluation(self, run_id: str, evaluation: EvaluationResult) -> None:
-        async with self._lock:
-            run = self._runs[run_id]
-            run.evaluation = evaluation
-            run.update_timestamp()
+        run = self._runs[run_id]
+        run.evaluation = evaluation
+        run.update_timestamp()
+
+
+def _create_run_store() -> RunStore:
+    settings = get_settings()
+    if settings.redis_url:
+        from app.services.redis_event_bus import get_redis
+        from app.services.redis_run_store import RedisRunStore
+
+        return RedisRunStore(get_redis(settings.redis_url), retention_seconds=settings.run_retention_minutes * 60)
+    return RunStore()
 
 
-run_store = RunStore()
+run_store = _create_run_store()
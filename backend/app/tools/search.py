@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence
 
-import anyio
-import functools
-from tavily import TavilyClient
+import httpx
 
 from app.core.settings import get_settings
+from app.utils import fastjson
+
+TAVILY_BASE_URL = "https://api.tavily.com"
 
 
 @dataclass(slots=True)
@@ -19,23 +24,140 @@ class SearchResult:
     url: str
 
 
+SearchKey = tuple[str, int]
+
+
+class SearchCache:
+    """TTL + LRU cache mapping a normalised (query, limit) pair to its search results.
+
+    Empty results are cached too, under a shorter TTL, so a query that found nothing
+    is not re-sent immediately but still gets retried soon.
+    """
+
+    def __init__(self, ttl_seconds: float, negative_ttl_seconds: float, max_entries: int) -> None:
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._max_entries = max_entries
+        # Reads and writes never span an await, so the event loop serialises access without a lock.
+        self._entries: OrderedDict[SearchKey, tuple[float, List[SearchResult]]] = OrderedDict()
+
+    @staticmethod
+    def make_key(query: str, limit: int) -> SearchKey:
+        return query.strip().lower(), limit
+
+    def get(self, key: SearchKey) -> Optional[List[SearchResult]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        ttl = self._ttl if results else self._negative_ttl
+        if time.monotonic() - stored_at > ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def set(self, key: SearchKey, results: List[SearchResult]) -> None:
+        self._entries[key] = (time.monotonic(), results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_search_cache() -> SearchCache:
+    """Return the process-wide search cache configured from settings."""
+
+    settings = get_settings()
+    return SearchCache(
+        ttl_seconds=settings.search_cache_ttl_seconds,
+        negative_ttl_seconds=settings.search_cache_negative_ttl_seconds,
+        max_entries=settings.search_cache_max_entries,
+    )
+
+
+@lru_cache(maxsize=1)
+def _shared_tavily_client() -> httpx.AsyncClient:
+    # One pooled client per process so concurrent subagent searches reuse warm connections.
+    return httpx.AsyncClient(
+        base_url=TAVILY_BASE_URL,
+        headers={
+            "Authorization": f"Bearer {get_settings().tavily_api_key}",
+            "Content-Type": "application/json",
+        },
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+async def close_search_client() -> None:
+    """Close the process-wide Tavily HTTP client; called on application shutdown."""
+
+    if _shared_tavily_client.cache_info().currsize:
+        await _shared_tavily_client().aclose()
+        _shared_tavily_client.cache_clear()
+
+
 class SearchTool:
-    """Wrapper around the Tavily search API."""
+    """Async client for the Tavily search REST API."""
 
-    def __init__(self) -> None:
-        settings = get_settings()
-        api_key = settings.tavily_api_key
-        self._client = TavilyClient(api_key=api_key)
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        # Looked up per request so the shared SearchTool never holds a client closed on shutdown.
+        return _shared_tavily_client()
 
     async def search(self, query: str, limit: int = 3) -> List[SearchResult]:
-        if not query or not query.strip():
+        # isspace() scans in place instead of allocating a stripped copy of the query.
+        if not query or query.isspace():
             return []
-        call = functools.partial(self._client.search, query=query, max_results=limit)
-        response = await anyio.to_thread.run_sync(call)
-        results = response.get("results", []) if response else []
+        cache = get_search_cache()
+        cache_key = cache.make_key(query, limit)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            # Hand out a copy so callers can't reorder or trim the cached list.
+            return list(cached)
+
+        response = await self._client.post(
+            "/search",
+            content=fastjson.dumps_bytes({"query": query, "max_results": limit}),
+        )
+        response.raise_for_status()
+        results = fastjson.loads(response.content).get("results") or []
         if not results:
+            cache.set(cache_key, [])
             return []
-        return [
-            SearchResult(title=result["title"], snippet=result.get("content", ""), url=result["url"])
-            for result in results
-        ]
+        # Positional arguments bind faster than keywords in the slotted dataclass __init__.
+        search_results = [SearchResult(result["title"], result.get("content", ""), result["url"]) for result in results]
+        cache.set(cache_key, search_results)
+        return list(search_results)
+
+    async def search_many(
+        self,
+        queries: Sequence[str],
+        limit: int = 3,
+        concurrency: int = 8,
+    ) -> List[List[SearchResult]]:
+        """Run several searches concurrently, returning results in the order of queries."""
+
+        # Queries that normalise to the same cache key share a single request.
+        keys = [SearchCache.make_key(query, limit) for query in queries]
+        unique: dict[SearchKey, str] = {}
+        for key, query in zip(keys, queries):
+            unique.setdefault(key, query)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(query: str) -> List[SearchResult]:
+            async with semaphore:
+                return await self.search(query, limit)
+
+        results = await asyncio.gather(*(run_one(query) for query in unique.values()))
+        by_key = dict(zip(unique, results))
+        return [list(by_key[key]) for key in keys]
+
+
+@lru_cache(maxsize=1)
+def get_search_tool() -> SearchTool:
+    """Return a process-wide SearchTool so every subagent shares one client and cache."""
+
+    return SearchTool()
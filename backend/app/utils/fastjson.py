@@ -0,0 +1,28 @@
+"""orjson-backed JSON helpers with stdlib-style call signatures."""
+
+from __future__ import annotations
+
+from typing import Any, Union
+
+import orjson
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers keep working.
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def loads(payload: Union[str, bytes]) -> Any:
+    """Parse a JSON document from str or bytes."""
+
+    return orjson.loads(payload)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string with non-ASCII characters kept as-is."""
+
+    return orjson.dumps(obj).decode("utf-8")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes, e.g. for HTTP request bodies."""
+
+    return orjson.dumps(obj)
@@ -2,14 +2,77 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict
+import re
+from typing import Any, Collection, Dict, Optional
+
+from app.utils import fastjson
+
+_FIRST_NON_SPACE = re.compile(r"\S")
 
 
 def extract_json(payload: str) -> Dict[str, Any]:
     """Attempt to parse JSON from payload; fallback to wrapping raw text."""
 
+    # Prose is the common case; skip the parser (and its exception) unless this could be JSON.
+    # Peeking via the regex avoids copying the whole payload just to look at one character.
+    first = _FIRST_NON_SPACE.search(payload)
+    if first is None or first.group() not in "{[":
+        return {"report": payload, "citations": []}
+
     try:
-        return json.loads(payload)
-    except json.JSONDecodeError:
+        # orjson skips leading whitespace itself, so the payload is parsed in place.
+        return fastjson.loads(payload)
+    except fastjson.JSONDecodeError:
         return {"report": payload, "citations": []}
+
+
+def find_json_object(payload: str, keys: Collection[str]) -> Optional[Dict[str, Any]]:
+    """Return the outermost ``{...}`` block in payload that is a JSON object with one of keys.
+
+    Brace pairs are collected in a single pass with a stack, tracking string/escape
+    state so braces inside JSON strings are ignored. Blocks that do not parse (e.g. a
+    ``{n}`` placeholder in prose) or lack the expected keys (e.g. a nested citation
+    inside a reply cut off at max_tokens) are skipped, so callers can fall back.
+    """
+
+    for start, end in _brace_pairs(payload):
+        try:
+            parsed = fastjson.loads(payload[start:end])
+        except fastjson.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict) and any(key in parsed for key in keys):
+            return parsed
+    return None
+
+
+def _brace_pairs(payload: str) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` slices of every balanced brace pair, outermost first."""
+
+    start = payload.find("{")
+    if start == -1:
+        return []
+
+    pairs: list[tuple[int, int]] = []
+    stack: list[int] = []
+    in_string = False
+    escaped = False
+    for index in range(start, len(payload)):
+        char = payload[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            stack.append(index)
+        elif not stack:
+            # Quotes and stray braces in prose between objects are not JSON.
+            continue
+        elif char == '"':
+            in_string = True
+        elif char == "}":
+            pairs.append((stack.pop(), index + 1))
+    pairs.sort()
+    return pairs
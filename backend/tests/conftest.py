@@ -0,0 +1,4 @@
+import os
+
+# Settings are read at import time by the services; tests never reach the real APIs.
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from app.models.enums import EventType
+from app.models.events import RunEvent
+from app.services.event_batcher import EventBatcher
+
+
+def _event(index: int) -> RunEvent:
+    return RunEvent(run_id="run-1", type=EventType.TOOL_CALL, payload={"index": index})
+
+
+def _indices(batch: list[RunEvent]) -> list[int]:
+    return [event.payload["index"] for event in batch]
+
+
+@pytest.mark.asyncio
+async def test_deferred_flush_failure_is_logged_and_requeued(caplog):
+    delivered: list[list[int]] = []
+    failures = [RuntimeError("sink down")]
+
+    async def sink(batch: list[RunEvent]) -> None:
+        if failures:
+            raise failures.pop()
+        delivered.append(_indices(batch))
+
+    batcher = EventBatcher(sink, max_batch=32, max_delay=0.001)
+    await batcher.put(_event(0))
+    await asyncio.sleep(0.02)
+
+    assert delivered == []
+    assert "re-queued" in caplog.text
+
+    await batcher.put(_event(1))
+    await batcher.flush()
+    assert delivered == [[0, 1]]
+    batcher._flush_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_explicit_flush_surfaces_sink_errors():
+    async def sink(batch: list[RunEvent]) -> None:
+        raise RuntimeError("sink down")
+
+    batcher = EventBatcher(sink, max_delay=60)
+    await batcher.put(_event(0))
+    with pytest.raises(RuntimeError):
+        await batcher.flush()
+    assert len(batcher._buffer) == 1
+    batcher._flush_task.cancel()
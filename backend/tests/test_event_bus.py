@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from app.models.enums import EventType
+from app.models.events import RunEvent
+from app.services.event_bus import TOKEN_FLUSH_INTERVAL, EventBus
+from app.utils import fastjson
+
+
+def _token(delta: str, agent_id: str = "a") -> RunEvent:
+    return RunEvent(run_id="run-1", type=EventType.LLM_TOKEN, agent_id=agent_id, payload={"delta": delta})
+
+
+def _drain(queue: asyncio.Queue) -> list[dict]:
+    frames = []
+    while not queue.empty():
+        frames.append(fastjson.loads(queue.get_nowait()))
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_coalesced_per_agent():
+    bus = EventBus()
+    subscription = await bus.subscribe("run-1")
+    for delta in ("Hel", "lo", " world"):
+        await bus.publish(_token(delta))
+    await bus.publish(_token("Other", agent_id="b"))
+    assert subscription.queue.empty()
+
+    await asyncio.sleep(TOKEN_FLUSH_INTERVAL * 2)
+
+    frames = _drain(subscription.queue)
+    assert [(frame["agent_id"], frame["payload"]["delta"]) for frame in frames] == [("a", "Hello world"), ("b", "Other")]
+
+
+@pytest.mark.asyncio
+async def test_buffered_tokens_are_flushed_before_other_events():
+    bus = EventBus()
+    subscription = await bus.subscribe("run-1")
+    await bus.publish(_token("partial"))
+    await bus.publish_batch([RunEvent(run_id="run-1", type=EventType.TOOL_CALL, agent_id="a")])
+
+    assert [frame["type"] for frame in _drain(subscription.queue)] == ["llm_token", "tool_call"]
+    await asyncio.sleep(TOKEN_FLUSH_INTERVAL * 2)
+    assert subscription.queue.empty()
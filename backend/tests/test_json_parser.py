@@ -0,0 +1,79 @@
+import pytest
+
+from app.agents.citation import CitationAgent
+from app.agents.evaluator import EvaluationAgent
+from app.utils.json_parser import extract_json, find_json_object
+
+CITATION_KEYS = ("report",)
+JUDGE_KEYS = ("rubric_scores", "overall_score")
+
+# Replies cut off at max_tokens: the outer object never closes but nested ones do.
+CUT_OFF_CITATION = (
+    '{"report": "Solar is cheap [1] and wind is growing [2].", "citations": '
+    '[{"citation": "Source 1", "url": "https://a.example"}, {"citation": "Source 2", "url": "https://b.example"}'
+)
+CUT_OFF_JUDGE = '{"rubric_scores": {"accuracy": 0.9, "completeness": 0.8}, "overall_score": 0.85, "feedback": "Str'
+
+
+def test_find_json_object_returns_none_without_braces():
+    assert find_json_object("no structured output here", CITATION_KEYS) is None
+
+
+def test_find_json_object_ignores_trailing_prose():
+    payload = 'Here you go: {"report": "done", "citations": []} Let me know!'
+    assert find_json_object(payload, CITATION_KEYS) == {"report": "done", "citations": []}
+
+
+def test_find_json_object_skips_unparseable_blocks():
+    payload = 'I used {n} markers as requested: {"report": "see [1]", "citations": [{"id": 1}]}'
+    assert find_json_object(payload, CITATION_KEYS) == {"report": "see [1]", "citations": [{"id": 1}]}
+
+
+def test_find_json_object_rejects_nested_objects_of_a_cut_off_reply():
+    assert find_json_object(CUT_OFF_CITATION, CITATION_KEYS) is None
+    assert find_json_object(CUT_OFF_JUDGE, JUDGE_KEYS) is None
+
+
+def test_find_json_object_prefers_the_outermost_match():
+    payload = 'Result: {"rubric_scores": {"overall_score": 1}, "overall_score": 0.5} done'
+    assert find_json_object(payload, JUDGE_KEYS)["overall_score"] == 0.5
+
+
+def test_find_json_object_is_linear_on_unmatched_braces():
+    assert find_json_object("{" * 20_000 + '"report"', CITATION_KEYS) is None
+
+
+@pytest.mark.asyncio
+async def test_cut_off_citation_reply_falls_back_to_formatted_report(monkeypatch):
+    agent = CitationAgent("run-1", [{"summary": "Solar is cheap", "sources": ["https://a.example"]}])
+
+    async def fake_plan_with_llm(*args, **kwargs):
+        return CUT_OFF_CITATION
+
+    monkeypatch.setattr(agent, "plan_with_llm", fake_plan_with_llm)
+    result = await agent._generate_with_llm()
+
+    assert result["report"].startswith(CUT_OFF_CITATION)
+    assert result["citations"] == [{"citation": "Source 1", "url": "https://a.example"}]
+
+
+def test_cut_off_judge_reply_uses_the_default_payload():
+    agent = EvaluationAgent("run-1", report="r", citations=[])
+    assert agent._parse_response(CUT_OFF_JUDGE) == EvaluationAgent._default_payload(CUT_OFF_JUDGE)
+
+
+def test_find_json_object_handles_braces_and_escapes_in_strings():
+    payload = 'prefix {"report": "a } brace and a \\"quoted {\\" bit"} suffix'
+    assert find_json_object(payload, CITATION_KEYS) == {"report": 'a } brace and a "quoted {" bit'}
+
+
+def test_find_json_object_skips_non_object_json():
+    assert find_json_object('{1} then ["report"] then {"report": ""}', CITATION_KEYS) == {"report": ""}
+
+
+def test_extract_json_wraps_prose():
+    assert extract_json("  plain text") == {"report": "  plain text", "citations": []}
+
+
+def test_extract_json_parses_leading_whitespace_json():
+    assert extract_json('\n {"report": "r"}') == {"report": "r"}
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.agents import base
+from app.core.settings import get_settings
+from app.llm.client import LLMClient
+from app.models.enums import AgentRole
+from app.utils import fastjson
+
+
+def _sse(delta: dict) -> str:
+    return "data: " + fastjson.dumps({"choices": [{"delta": delta}]})
+
+
+@pytest.mark.asyncio
+async def test_stream_parses_sse_deltas_until_done():
+    body = "\n".join(
+        [
+            ": keep-alive",
+            "event: message",
+            _sse({"role": "assistant"}),
+            _sse({"content": "Hel"}),
+            "",
+            "data: " + fastjson.dumps({"choices": []}),
+            _sse({"content": ""}),
+            "data:" + fastjson.dumps({"choices": [{"delta": {"content": "lo"}}]}),
+            "data: [DONE]",
+            _sse({"content": "after done"}),
+        ]
+    )
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    client = LLMClient(get_settings())
+    await client.close()
+    client._own_client = httpx.AsyncClient(base_url="https://llm.test/v1", transport=httpx.MockTransport(handler))
+    try:
+        chunks = [chunk async for chunk in client.stream("prompt")]
+    finally:
+        await client.close()
+
+    assert chunks == ["Hel", "lo"]
+    assert len(requests) == 1
+    assert fastjson.loads(requests[0].content)["stream"] is True
+
+
+class _Agent(base.BaseAgent):
+    async def run(self) -> Any:  # pragma: no cover - not exercised
+        return None
+
+
+def _agent_with_stream(monkeypatch, stream) -> _Agent:
+    monkeypatch.setattr(base, "LLM_RETRY_MAX_DELAY", 0.0)
+    monkeypatch.setattr(base, "LLM_RETRY_JITTER", 0.0)
+    agent = _Agent("run-llm", name="Test Agent", role=AgentRole.SUBAGENT)
+    settings = get_settings().model_copy(update={"llm_cache_enabled": False, "llm_stream_tokens": True})
+    agent.llm = SimpleNamespace(_settings=settings, stream=stream)
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_failure_after_forwarded_tokens_is_not_retried(monkeypatch):
+    attempts = 0
+
+    async def stream(*args, **kwargs):
+        nonlocal attempts
+        attempts += 1
+        yield "partial "
+        raise HTTPException(status_code=504, detail="LLM request failed")
+
+    agent = _agent_with_stream(monkeypatch, stream)
+    with pytest.raises(HTTPException):
+        await agent.plan_with_llm("prompt")
+    assert attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_before_any_token_is_retried(monkeypatch):
+    attempts = 0
+
+    async def stream(*args, **kwargs):
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise HTTPException(status_code=504, detail="LLM request failed")
+        yield "complete answer"
+
+    agent = _agent_with_stream(monkeypatch, stream)
+    assert await agent.plan_with_llm("prompt") == "complete answer"
+    assert attempts == 3
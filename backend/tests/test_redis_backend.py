@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.models.enums import AgentRole, AgentStatus, EventType, RunStatus
+from app.models.events import RunEvent
+from app.models.run import EvaluationResult
+from app.services.event_bus import SUBSCRIBER_QUEUE_SIZE
+from app.services.redis_event_bus import RedisEventBus
+from app.services.redis_run_store import RedisRunStore
+
+
+def _client():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_run_round_trip_decodes_dates_and_enums():
+    store = RedisRunStore(_client(), retention_seconds=60)
+    run = await store.create_run("What is Redis?", goal="Explain streams")
+    agent = await store.add_agent(run.id, "Subagent 1", AgentRole.SUBAGENT, brief="streams")
+    await store.update_agent_status(run.id, agent.id, AgentStatus.COMPLETED)
+    await store.update_run_status(run.id, RunStatus.COMPLETED)
+    await store.save_final_report(run.id, "report", [{"citation": "[1]", "url": "https://redis.io"}])
+    await store.save_evaluation(
+        run.id, EvaluationResult(rubric_scores={"accuracy": 0.9}, overall_score=0.9, passed=True)
+    )
+
+    loaded = await store.get_run(run.id)
+
+    assert loaded is not None
+    assert (loaded.query, loaded.goal) == ("What is Redis?", "Explain streams")
+    assert loaded.status is RunStatus.COMPLETED
+    assert isinstance(loaded.created_at, datetime) and loaded.created_at == run.created_at
+    assert isinstance(loaded.updated_at, datetime) and loaded.updated_at >= run.created_at
+    assert loaded.agents[agent.id].role is AgentRole.SUBAGENT
+    assert loaded.agents[agent.id].status is AgentStatus.COMPLETED
+    assert loaded.final_report == "report"
+    assert loaded.citations == [{"citation": "[1]", "url": "https://redis.io"}]
+    assert loaded.evaluation.passed and loaded.evaluation.rubric_scores == {"accuracy": 0.9}
+    assert await store.get_run("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_events_replay_in_order_with_stream_ids():
+    store = RedisRunStore(_client(), retention_seconds=60)
+    run = await store.create_run("q")
+    sent = [
+        RunEvent(run_id=run.id, type=EventType.RUN_STARTED),
+        RunEvent(run_id=run.id, type=EventType.TOOL_CALL, agent_id="a", payload={"tool": "search"}),
+    ]
+    await store.add_events_bulk(sent)
+
+    replayed = await store.get_events(run.id)
+
+    assert [event.type for event in replayed] == [EventType.RUN_STARTED, EventType.TOOL_CALL]
+    assert [event.id for event in replayed] == [event.id for event in sent]
+    assert replayed[1].payload == {"tool": "search"} and replayed[1].agent_id == "a"
+    # Timestamps survive the epoch-microsecond round trip
+    assert [event._epoch_us for event in replayed] == [event._epoch_us for event in sent]
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_is_flagged():
+    bus = RedisEventBus(_client())
+    subscription = await bus.subscribe("run-1")
+    try:
+        for index in range(SUBSCRIBER_QUEUE_SIZE + 1):
+            await bus.publish(RunEvent(run_id="run-1", type=EventType.TOOL_CALL, payload={"index": index}))
+        for _ in range(100):
+            if subscription.lagging:
+                break
+            await asyncio.sleep(0.01)
+        assert subscription.lagging
+        assert subscription.queue.full()
+    finally:
+        await bus.unsubscribe("run-1", subscription)
@@ -0,0 +1,28 @@
+import pytest
+
+from app.tools.search import SearchResult, SearchTool
+
+
+@pytest.mark.asyncio
+async def test_search_many_dedupes_queries_and_preserves_order(monkeypatch):
+    calls: list[tuple[str, int]] = []
+
+    async def fake_search(query: str, limit: int = 3) -> list[SearchResult]:
+        calls.append((query, limit))
+        return [SearchResult(query.strip().lower(), "", f"https://example.com/{query.strip().lower()}")]
+
+    tool = SearchTool()
+    monkeypatch.setattr(tool, "search", fake_search)
+
+    results = await tool.search_many(["Alpha", "beta", "  alpha ", "gamma", "BETA"], limit=5)
+
+    assert calls == [("Alpha", 5), ("beta", 5), ("gamma", 5)]
+    assert [[res.title for res in batch] for batch in results] == [
+        ["alpha"],
+        ["beta"],
+        ["alpha"],
+        ["gamma"],
+        ["beta"],
+    ]
+    # Duplicates share results but not list objects, so callers can mutate their own copy.
+    assert results[0] is not results[2]
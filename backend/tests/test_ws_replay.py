@@ -0,0 +1,33 @@
+from app.api.routes import _event_id_key, _skip_replayed
+from app.utils import fastjson
+
+
+def _event(event_id, event_type="tool_call"):
+    return {"type": event_type, "timestamp": 1, "payload": {}, "agent_id": "a", "id": event_id}
+
+
+def test_event_id_key_orders_stream_ids_numerically():
+    assert _event_id_key("1700000000000-10") > _event_id_key("1700000000000-9")
+    assert _event_id_key("12") > _event_id_key("9")
+
+
+def test_skip_replayed_drops_events_already_in_history():
+    cursor = _event_id_key("3")
+    assert _skip_replayed(fastjson.dumps(_event("2")), cursor) == (None, False)
+
+    frame = fastjson.dumps({"type": "batch", "events": [_event("3"), _event("4"), _event("5")]})
+    filtered, caught_up = _skip_replayed(frame, cursor)
+    assert caught_up
+    assert [event["id"] for event in fastjson.loads(filtered)["events"]] == ["4", "5"]
+
+
+def test_skip_replayed_passes_live_only_events_without_ending_catch_up():
+    frame = fastjson.dumps(_event(None, "llm_token"))
+    assert _skip_replayed(frame, _event_id_key("3")) == (frame, False)
+
+
+def test_skip_replayed_unwraps_single_survivor():
+    frame = fastjson.dumps({"type": "batch", "events": [_event("3"), _event("4")]})
+    filtered, caught_up = _skip_replayed(frame, _event_id_key("3"))
+    assert caught_up
+    assert fastjson.loads(filtered) == _event("4")
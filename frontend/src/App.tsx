@@ -1,7 +1,7 @@
 import { useEffect, useMemo, useState, type ChangeEvent } from 'react';
 import { useMutation, useQuery } from '@tanstack/react-query';
 
-import type { CitationEntry, EvaluationResult, EventMessage, RunSummary } from './types';
+import type { CitationEntry, EvaluationResult, EventMessage, HistoryMessage, RunSummary } from './types';
 import qrCodeImage from './assets/ewm.png';
 
 const API_BASE = (import.meta as ImportMeta & { env: Record<string, string> }).env.VITE_API_BASE ??
@@ -20,12 +20,13 @@ const BEIJING_TIME_FORMATTER = new Intl.DateTimeFormat('zh-CN', {
   hour12: false,
 });
 
-const formatBeijingTime = (timestamp: string) => {
+// Event timestamps arrive as UTC epoch microseconds.
+const formatBeijingTime = (timestamp: number) => {
   try {
-    return BEIJING_TIME_FORMATTER.format(new Date(timestamp));
+    return BEIJING_TIME_FORMATTER.format(new Date(timestamp / 1000));
   } catch (error) {
     console.error('Failed to format timestamp', error);
-    return timestamp;
+    return String(timestamp);
   }
 };
 
@@ -34,6 +35,7 @@ export default function App() {
   const [goal, setGoal] = useState('总结生态和差异。');
   const [activeRunId, setActiveRunId] = useState<string>('');
   const [events, setEvents] = useState<EventMessage[]>([]);
+  const [liveOutput, setLiveOutput] = useState<Record<string, string>>({});
   const [showQr, setShowQr] = useState(true);
 
   const visibleEvents = useMemo(() =>
@@ -53,8 +55,37 @@ export default function App() {
     const socket = new WebSocket(`${WS_BASE}/runs/${activeRunId}`);
     socket.onmessage = (message: MessageEvent<string>) => {
       try {
-        const data = JSON.parse(message.data) as EventMessage;
-        setEvents((prev: EventMessage[]) => [...prev, data]);
+        const data = JSON.parse(message.data) as EventMessage | HistoryMessage;
+        if (data.type === 'history' || data.type === 'batch') {
+          // Replayed backlogs and coalesced live events both arrive as one batched message.
+          const batched = (data as HistoryMessage).events;
+          const finishedAgents = batched
+            .filter((event: EventMessage) => event.type === 'tool_call')
+            .map((event: EventMessage) => event.agent_id ?? 'lead');
+          if (finishedAgents.length) {
+            setLiveOutput((prev: Record<string, string>) =>
+              Object.fromEntries(Object.entries(prev).filter(([agentKey]) => !finishedAgents.includes(agentKey))),
+            );
+          }
+          setEvents((prev: EventMessage[]) => [...prev, ...batched]);
+          return;
+        }
+        const event = data as EventMessage;
+        const agentKey = event.agent_id ?? 'lead';
+        if (event.type === 'llm_token') {
+          // Streamed tokens only feed the live output preview, not the event timeline.
+          const delta = String((event.payload as any)?.delta ?? '');
+          setLiveOutput((prev: Record<string, string>) => ({ ...prev, [agentKey]: (prev[agentKey] ?? '') + delta }));
+          return;
+        }
+        if (event.type === 'tool_call') {
+          // The LLM call has settled, so its streamed preview is no longer needed.
+          setLiveOutput((prev: Record<string, string>) => {
+            const { [agentKey]: _finished, ...rest } = prev;
+            return rest;
+          });
+        }
+        setEvents((prev: EventMessage[]) => [...prev, event]);
       } catch (error) {
         console.error('Failed to parse event message', error);
       }
@@ -92,6 +123,7 @@ export default function App() {
     onSuccess: (data: { run_id: string }) => {
       setActiveRunId(data.run_id);
       setEvents([]);
+      setLiveOutput({});
     },
   });
 
@@ -151,6 +183,14 @@ export default function App() {
             <h2>Live Event Stream</h2>
             <p>WebSocket feed of planning, delegation, tool calls and synthesis.</p>
           </div>
+          {Object.entries(liveOutput).map(([agentKey, text]) => (
+            <article key={`live-${agentKey}`} className="event-item">
+              <div className="event-meta">
+                <span className="event-type">llm streaming</span>
+              </div>
+              <pre>{text}</pre>
+            </article>
+          ))}
           <div className="events" data-empty={!visibleEvents.length}>
             {visibleEvents.length === 0 && <p className="muted">Run events will appear here once started.</p>}
             {visibleEvents.map((event: EventMessage, idx: number) => (
@@ -23,7 +23,13 @@ export type RunSummary = {
 
 export type EventMessage = {
   type: string;
-  timestamp: string;
+  timestamp: number;
   payload: Record<string, unknown>;
   agent_id?: string;
+  id?: string | null;
+};
+
+export type HistoryMessage = {
+  type: 'history' | 'batch';
+  events: EventMessage[];
 };
@@ -3,20 +3,41 @@
 Test script to monitor the multi-agent research system
 """
 import asyncio
-import json
 import time
+
+import httpx
+import orjson
 import websockets
-import requests
+
+BASE_URL = "http://localhost:8001"
+WS_BASE_URL = BASE_URL.replace("http", "ws", 1)
+
+FINISHED_EVENT_TYPES = {"run_completed", "run_failed"}
+
+
+def is_run_finished(data):
+    """Return True when a WebSocket frame reports that the run has finished."""
+    if data.get("type") == "run_state":
+        return data.get("status") in ("completed", "failed")
+    events = data.get("events", []) if data.get("type") in ("batch", "history") else [data]
+    return any(event.get("type") in FINISHED_EVENT_TYPES for event in events)
+
 
 async def test_research_system():
+    # One async client for every HTTP call: it reuses the pooled connection and never blocks
+    # the event loop that is servicing the WebSocket.
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as http:
+        await monitor_run(http)
+
+
+async def monitor_run(http):
     # Start a research task
     print("Starting research task...")
-    response = requests.post(
-        "http://localhost:8001/research",
+    response = await http.post(
+        "/api/runs",
         json={
             "query": "What are the key benefits of renewable energy?",
-            "max_subagents": 2,
-            "search_depth": "medium"
+            "goal": "Summarise the main environmental and economic benefits"
         }
     )
     
@@ -24,58 +45,46 @@ async def test_research_system():
         print(f"Failed to start research: {response.text}")
         return
     
-    result = response.json()
+    result = orjson.loads(response.content)
     run_id = result["run_id"]
     print(f"Research started with run ID: {run_id}")
     
     # Connect to WebSocket for real-time updates
-    ws_url = f"ws://localhost:8001/ws/{run_id}"
+    ws_url = f"{WS_BASE_URL}/api/ws/runs/{run_id}"
     
     try:
-        async with websockets.connect(ws_url) as websocket:
+        # Keepalive uses protocol-level ping frames handled by the library, not JSON messages
+        async with websockets.connect(ws_url, ping_interval=20, ping_timeout=10) as websocket:
             print("Connected to WebSocket")
             
-            # Send initial message
-            await websocket.send(json.dumps({"type": "ping"}))
-            
-            # Listen for updates
-            start_time = time.time()
-            while time.time() - start_time < 60:  # Run for max 60 seconds
-                try:
-                    message = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    data = json.loads(message)
-                    print(f"Received: {data}")
-                    
-                    # Check if research is complete
-                    if data.get("type") == "agent_event" and data.get("data", {}).get("event_type") == "research_complete":
-                        print("Research completed!")
-                        break
-                        
-                except asyncio.TimeoutError:
-                    # Check research status
-                    status_response = requests.get(f"http://localhost:8001/runs/{run_id}")
-                    if status_response.status_code == 200:
-                        status = status_response.json()
-                        print(f"Current status: {status['status']}")
-                        if status['status'] in ['completed', 'failed']:
+            # Listen for updates under a single 60 second budget
+            start_time = time.monotonic()
+            try:
+                async with asyncio.timeout(60):
+                    while True:
+                        data = orjson.loads(await websocket.recv())
+                        print(f"Received: {data}")
+
+                        # The server streams run_completed/run_failed, so no status polling is needed
+                        if is_run_finished(data):
+                            print(f"Research completed in {time.monotonic() - start_time:.1f}s!")
                             break
-                    
-                    # Send ping to keep connection alive
-                    await websocket.send(json.dumps({"type": "ping"}))
-                    
+            except TimeoutError:
+                print("Stopped listening after 60 seconds")
+            
     except Exception as e:
         print(f"WebSocket error: {e}")
     
-    # Get final results
-    final_response = requests.get(f"http://localhost:8001/runs/{run_id}")
+    # Get final results (also the fallback if the WebSocket dropped before the run finished)
+    final_response = await http.get(f"/api/runs/{run_id}")
     if final_response.status_code == 200:
-        final_data = final_response.json()
+        final_data = orjson.loads(final_response.content)
         print(f"\nFinal status: {final_data['status']}")
         if final_data.get('final_report'):
             print(f"Report length: {len(final_data['final_report'])} characters")
             print(f"Citations: {len(final_data['citations'])}")
-        if final_data.get('subagents'):
-            print(f"Subagents used: {len(final_data['subagents'])}")
+        if final_data.get('evaluation'):
+            print(f"Evaluation score: {final_data['evaluation']['overall_score']}")
 
 if __name__ == "__main__":
     asyncio.run(test_research_system())
\ No newline at end of file